@@ -14,172 +14,924 @@ Usage:
 """
 
 import argparse
+import functools
 import hashlib
 import json
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path, PurePath
 from typing import Dict, List, Optional, Set, Tuple
 
+try:
+    import blake3  # SIMD-accelerated hashing, several GB/s per core
+except ImportError:
+    blake3 = None
+
+try:
+    import hyperscan  # JIT'd multi-pattern matching in a single linear scan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson  # C-speed JSON encode/decode of the state file
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # compact binary sidecar for fast state reload
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import numba  # JIT for the diff merge loop; needs numpy as well
+except ImportError:
+    numba = None
+
+try:
+    import cartographer_fast  # Rust extension: walk + glob + BLAKE3 in one call
+except ImportError:
+    cartographer_fast = None
+else:
+    if not hasattr(cartographer_fast, "scan_and_hash"):
+        # The unbuilt crate directory next to this script is importable
+        # as a namespace package; only use a real built extension
+        cartographer_fast = None
+
 VERSION = "1.0.0"
 STATE_DIR = ".slim"
 STATE_FILE = "cartography.json"
+MSGPACK_FILE = "cartography.msgpack"
 CODEMAP_FILE = "codemap.md"
 
 
-def load_gitignore(root: Path) -> List[str]:
-    """Load .gitignore patterns from the repository root."""
+def _normalize_gitignore(line: str) -> Tuple[bool, str]:
+    """Normalize one .gitignore line into (is_negation, glob pattern)."""
+    is_negation = line.startswith("!")
+    if is_negation:
+        line = line[1:]
+    elif line.startswith("\\!") or line.startswith("\\#"):
+        line = line[1:]  # escaped leading ! or # is literal
+    return is_negation, line
+
+
+def load_gitignore(root: Path) -> Tuple[List[str], List[str]]:
+    """Load .gitignore patterns from the repository root.
+
+    Returns (patterns, negations): the ignore globs in the same
+    canonical form the exclude patterns use, and the "!"-prefixed
+    re-include globs separately.
+    """
     gitignore_path = root / ".gitignore"
-    patterns = []
+    patterns: List[str] = []
+    negations: List[str] = []
     if gitignore_path.exists():
         with open(gitignore_path, "r", encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
-                if line and not line.startswith("#"):
-                    patterns.append(line)
-    return patterns
+                if not line or line.startswith("#"):
+                    continue
+                is_negation, pattern = _normalize_gitignore(line)
+                if pattern:
+                    (negations if is_negation else patterns).append(pattern)
+    return patterns, negations
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Convert a single glob pattern to an anchored regex fragment."""
+    reg = re.escape(pattern)
+    reg = reg.replace(r'\*\*/', '(?:.*/)?')  # Recursive glob
+    reg = reg.replace(r'\*\*', '.*')
+    reg = reg.replace(r'\*', '[^/]*')  # Single level glob
+    reg = reg.replace(r'\?', '.')
+
+    if pattern.endswith('/'):
+        reg += '.*'
+
+    if pattern.startswith('/'):
+        reg = '^' + reg[1:]
+    else:
+        reg = '(?:^|.*/)' + reg
+
+    return f'(?:{reg}$)'
+
+
+def _has_wildcard(pattern: str) -> bool:
+    """Check whether a glob pattern contains any wildcard metacharacters."""
+    return any(c in pattern for c in "*?[")
+
+
+def _patterns_digest(patterns: List[str]) -> str:
+    """Stable digest of a pattern list, used as a compile-cache key."""
+    hasher = _new_hasher()
+    hasher.update("\0".join(patterns).encode())
+    return hasher.hexdigest()
 
 
 class PatternMatcher:
-    """Efficiently match paths against multiple glob patterns using pre-compiled regex."""
+    """Efficiently match paths against multiple glob patterns.
 
-    def __init__(self, patterns: List[str]):
-        if not patterns:
-            self.regex = None
-            return
+    Uses a hyperscan multi-pattern database when the binding is
+    installed (one linear scan regardless of pattern count), otherwise a
+    single combined pre-compiled regex. When cache_dir is given, the
+    compiled hyperscan database is serialized there keyed by a digest of
+    the pattern list, so later invocations skip compilation entirely.
+
+    Simple pattern shapes — *.ext suffixes, literal names, plain
+    directory prefixes — are answered by str/frozenset fast paths in
+    matches() and never reach the scan engine; only the residual
+    patterns are compiled.
+    """
+
+    def __init__(self, patterns: List[str], cache_dir: Optional[Path] = None):
+        self.regex = None
+        self._db = None
+        self._scratch = None
 
-        regex_parts = []
+        # Partition out shapes answerable by C-level string primitives
+        suffixes: List[str] = []
+        literals: List[str] = []
+        dir_prefixes: List[str] = []
+        residual: List[str] = []
         for pattern in patterns:
-            # Regex conversion logic
-            reg = re.escape(pattern)
-            reg = reg.replace(r'\*\*/', '(?:.*/)?')  # Recursive glob
-            reg = reg.replace(r'\*\*', '.*')
-            reg = reg.replace(r'\*', '[^/]*')  # Single level glob
-            reg = reg.replace(r'\?', '.')
-
-            if pattern.endswith('/'):
-                reg += '.*'
-
-            if pattern.startswith('/'):
-                reg = '^' + reg[1:]
+            if pattern.startswith("/"):
+                residual.append(pattern)
+            elif (
+                pattern.startswith("*.")
+                and "/" not in pattern
+                and not _has_wildcard(pattern[1:])
+            ):
+                suffixes.append(pattern[1:])  # "*.log" -> ".log"
+            elif (
+                pattern.startswith("**/*.")
+                and "/" not in pattern[3:]
+                and not _has_wildcard(pattern[4:])
+            ):
+                # "**/*.ts" matches at any depth, same as a bare suffix
+                suffixes.append(pattern[4:])  # "**/*.ts" -> ".ts"
+            elif pattern.endswith("/") and not _has_wildcard(pattern):
+                dir_prefixes.append("/" + pattern)  # match at segment boundary
+            elif not _has_wildcard(pattern):
+                literals.append(pattern)
             else:
-                reg = '(?:^|.*/)' + reg
-            
-            regex_parts.append(f'(?:{reg}$)')
-        
+                residual.append(pattern)
+
+        self.suffixes = tuple(sorted(suffixes))
+        self.literals = frozenset(literals)
+        self.literal_suffixes = tuple("/" + lit for lit in sorted(literals))
+        self.dir_prefixes = tuple(sorted(dir_prefixes))
+
+        # Directory patterns with wildcards ("build*/") get their own
+        # small regex so whole subtrees can be pruned during the walk
+        dir_residual = [p for p in residual if p.endswith("/")]
+        self.dir_regex = (
+            re.compile("|".join(_glob_to_regex(p) for p in dir_residual))
+            if dir_residual
+            else None
+        )
+
+        patterns = residual
+        if not patterns:
+            return
+
+        if hyperscan is not None:
+            cache_path = None
+            if cache_dir is not None:
+                digest = _patterns_digest(patterns)
+                cache_path = cache_dir / f"patterns-{digest[:16]}.db"
+                if cache_path.exists():
+                    try:
+                        self._db = hyperscan.loadb(
+                            cache_path.read_bytes(), hyperscan.HS_MODE_BLOCK
+                        )
+                        self._scratch = hyperscan.Scratch(self._db)
+                        return
+                    except (hyperscan.error, OSError, TypeError):
+                        # Stale or incompatible cache: recompile below
+                        self._db = None
+                        self._scratch = None
+
+        regex_parts = [_glob_to_regex(pattern) for pattern in patterns]
+
+        if hyperscan is not None:
+            try:
+                self._db = hyperscan.Database()
+                self._db.compile(
+                    expressions=[part.encode() for part in regex_parts],
+                    ids=list(range(len(regex_parts))),
+                    flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(regex_parts),
+                )
+                self._scratch = hyperscan.Scratch(self._db)
+                if cache_path is not None and cache_dir.is_dir():
+                    try:
+                        cache_path.write_bytes(hyperscan.dumpb(self._db))
+                    except (hyperscan.error, OSError):
+                        pass  # cache is best-effort
+                return
+            except hyperscan.error:
+                # Pattern uses a construct hyperscan rejects; use regex
+                self._db = None
+                self._scratch = None
+
         # Combine all patterns into a single regex for speed
         combined_regex = '|'.join(regex_parts)
         self.regex = re.compile(combined_regex)
 
+    @staticmethod
+    def _on_match(pat_id: int, start: int, end: int, flags: int, found: list) -> int:
+        found.append(pat_id)
+        return 1  # non-zero halts the scan at the first match
+
+    def matches_dir(self, rel_dir: str) -> bool:
+        """Check if a directory pattern matches everything under rel_dir.
+
+        Only consults the directory-shaped patterns (those ending "/"),
+        so a True result means every descendant path would match and the
+        walker can skip descending entirely.
+        """
+        if self.dir_prefixes:
+            slashed = "/" + rel_dir + "/"
+            for prefix in self.dir_prefixes:
+                if prefix in slashed:
+                    return True
+        if self.dir_regex is not None:
+            return bool(self.dir_regex.search(rel_dir + "/"))
+        return False
+
     def matches(self, path: str) -> bool:
         """Check if a path matches any of the patterns."""
+        if self.suffixes and path.endswith(self.suffixes):
+            return True
+        if path in self.literals:
+            return True
+        if self.literal_suffixes and path.endswith(self.literal_suffixes):
+            return True
+        if self.dir_prefixes:
+            slashed = "/" + path
+            for prefix in self.dir_prefixes:
+                if prefix in slashed:
+                    return True
+        if self._db is not None:
+            found: list = []
+            try:
+                self._db.scan(
+                    path.encode(),
+                    match_event_handler=self._on_match,
+                    context=found,
+                    scratch=self._scratch,
+                )
+            except hyperscan.ScanTerminated:
+                pass  # raised when _on_match halts the scan on a hit
+            return bool(found)
         if not self.regex:
             return False
         return bool(self.regex.search(path))
 
 
+@functools.lru_cache(maxsize=32)
+def _make_matcher(
+    patterns: Tuple[str, ...], cache_dir: Optional[Path] = None
+) -> PatternMatcher:
+    """Build (or reuse) a PatternMatcher for a tuple of patterns.
+
+    PatternMatcher is immutable after construction, so back-to-back
+    changes/update invocations in the same process reuse the compiled
+    matcher instead of recompiling identical pattern lists.
+    """
+    return PatternMatcher(list(patterns), cache_dir)
+
+
 def select_files(
     root: Path,
     include_patterns: List[str],
     exclude_patterns: List[str],
     exceptions: List[str],
     gitignore_patterns: List[str],
-) -> List[Path]:
-    """Select files based on include/exclude patterns and exceptions."""
-    selected = []
+    gitignore_negations: Optional[List[str]] = None,
+    sort: bool = False,
+) -> List[str]:
+    """Select files based on include/exclude patterns and exceptions.
+
+    Returns paths relative to root, as strings; pass sort=True when the
+    caller needs deterministic order (hashing and state construction
+    don't, so the O(N log N) sort is opt-in).
+
+    gitignore_negations are "!" re-include globs from .gitignore; a path
+    they match is rescued from a gitignore rejection (but not from an
+    explicit exclude).
+    """
+    selected: List[str] = []
+    negations = gitignore_negations or []
     
-    # Pre-compile matchers
-    include_matcher = PatternMatcher(include_patterns)
-    exclude_matcher = PatternMatcher(exclude_patterns)
-    gitignore_matcher = PatternMatcher(gitignore_patterns)
+    # Pre-compile matchers, reusing cached compiled databases once
+    # init has created the state directory
+    cache_dir: Optional[Path] = root / STATE_DIR
+    if not cache_dir.is_dir():
+        cache_dir = None
+    include_matcher = _make_matcher(tuple(include_patterns), cache_dir)
+    # Excludes and gitignore entries reject paths the same way, so
+    # compile them into one matcher and scan each path once. Exceptions
+    # only override excludes, so a gitignore-only matcher is kept for
+    # the (rare) exception paths.
+    reject_matcher = _make_matcher(
+        tuple(exclude_patterns) + tuple(gitignore_patterns), cache_dir
+    )
+    gitignore_matcher = (
+        _make_matcher(tuple(gitignore_patterns), cache_dir) if exceptions else None
+    )
+    negation_matcher = _make_matcher(tuple(negations), cache_dir) if negations else None
+    # Needed to tell excludes from gitignore when a negation matches
+    exclude_matcher = (
+        _make_matcher(tuple(exclude_patterns), cache_dir)
+        if negations and exclude_patterns
+        else None
+    )
     exception_set = set(exceptions)
     
     root_str = str(root)
-    
-    for dirpath, dirnames, filenames in os.walk(root_str):
-        # Skip hidden directories early by modifying dirnames in-place
-        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-        
-        rel_dir = os.path.relpath(dirpath, root_str)
-        if rel_dir == ".":
-            rel_dir = ""
-        
-        for filename in filenames:
-            rel_path = os.path.join(rel_dir, filename).replace("\\", "/")
-            if rel_path.startswith("./"):
-                rel_path = rel_path[2:]
-            
-            # Skip if ignored by .gitignore
-            if gitignore_matcher.matches(rel_path):
-                continue
-            
-            # Check explicit exclusions first
-            if exclude_matcher.matches(rel_path):
-                # Unless it's an exception
-                if rel_path not in exception_set:
+    rel_start = len(root_str) + 1  # strip root plus its trailing separator
+
+    # Stack-based scandir traversal: reuses the DirEntry type info from
+    # the directory read instead of re-stat'ing every path like os.walk,
+    # and slices relative paths instead of calling os.path functions.
+    stack = [root_str]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
                     continue
-            
-            # Check inclusions
-            if include_matcher.matches(rel_path) or rel_path in exception_set:
-                selected.append(root / rel_path)
-    
-    return sorted(selected)
+                if is_dir:
+                    # Skip hidden directories; don't follow symlinked ones
+                    if entry.name.startswith(".") or entry.is_symlink():
+                        continue
+                    rel_dir = entry.path[rel_start:]
+                    if os.sep != "/":
+                        rel_dir = rel_dir.replace(os.sep, "/")
+                    # Prune whole subtrees matched by directory patterns
+                    # instead of walking in and rejecting every file
+                    if reject_matcher.matches_dir(rel_dir):
+                        if negation_matcher is not None:
+                            # A negation may rescue files underneath;
+                            # walk in and decide per file
+                            pass
+                        elif not any(
+                            e.startswith(rel_dir + "/") for e in exception_set
+                        ):
+                            continue
+                        elif gitignore_matcher is not None and gitignore_matcher.matches_dir(
+                            rel_dir
+                        ):
+                            # Exceptions underneath don't override gitignore
+                            continue
+                    stack.append(entry.path)
+                    continue
+
+                rel_path = entry.path[rel_start:]
+                if os.sep != "/":
+                    rel_path = rel_path.replace(os.sep, "/")
+
+                # One scan decides both gitignore and explicit exclusion
+                if reject_matcher.matches(rel_path):
+                    if rel_path in exception_set:
+                        # Exceptions override excludes but not gitignore
+                        # (though a negation can)
+                        if (
+                            gitignore_matcher is not None
+                            and gitignore_matcher.matches(rel_path)
+                            and not (
+                                negation_matcher is not None
+                                and negation_matcher.matches(rel_path)
+                            )
+                        ):
+                            continue
+                    elif negation_matcher is not None and negation_matcher.matches(
+                        rel_path
+                    ):
+                        # Negations rescue gitignore rejections only,
+                        # never an explicit exclude
+                        if exclude_matcher is not None and exclude_matcher.matches(
+                            rel_path
+                        ):
+                            continue
+                    else:
+                        continue
 
+                # Check inclusions
+                if include_matcher.matches(rel_path) or rel_path in exception_set:
+                    selected.append(rel_path)
 
-def compute_file_hash(filepath: Path) -> str:
-    """Compute MD5 hash of file content."""
-    hasher = hashlib.md5()
+    if sort:
+        selected.sort()
+    return selected
+
+
+# Files below this size are cheaper to read outright than to mmap
+MMAP_THRESHOLD = 64 * 1024
+
+# posix_fadvise is Linux/BSD-only; lets the kernel batch reads ahead of us
+HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def _new_hasher():
+    """Return a fresh content hasher (BLAKE3 when available, MD5 otherwise)."""
+    if blake3 is not None:
+        return blake3.blake3()
+    return hashlib.md5()
+
+
+def compute_file_hash(filepath: Path) -> bytes:
+    """Compute a content hash of a file (BLAKE3 when available, MD5 otherwise).
+
+    Returns the raw digest bytes; hex conversion happens only when the
+    state is serialized.
+    """
     try:
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+            if HAS_FADVISE:
+                # We read each file front to back exactly once; tell the
+                # kernel so it queues aggressive readahead for the whole
+                # file instead of reacting to each read/fault.
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+
+            size = os.fstat(f.fileno()).st_size
+            if size < MMAP_THRESHOLD:
+                # Also covers empty files, which mmap refuses to map
+                hasher = _new_hasher()
+                hasher.update(f.read())
+                return hasher.digest()
+
+            try:
+                # Feed the whole mapped file to the hasher in a single
+                # GIL-releasing C call instead of an 8 KiB Python loop
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    if blake3 is not None:
+                        return blake3.blake3(
+                            memoryview(mm), max_threads=blake3.blake3.AUTO
+                        ).digest()
+                    hasher = hashlib.md5()
+                    hasher.update(mm)
+                    return hasher.digest()
+            except (ValueError, OSError):
+                # Pipes, devices and other unmappable files: chunked read
+                f.seek(0)
+                hasher = _new_hasher()
+                for chunk in iter(lambda: f.read(8192), b""):
+                    hasher.update(chunk)
+                return hasher.digest()
     except (IOError, OSError):
-        return ""
+        return b""
 
 
-def compute_folder_hash(folder: str, file_hashes: Dict[str, str]) -> str:
+def _hash_pool_size() -> int:
+    """Thread count for the hashing pool.
+
+    On Linux the fadvise hints keep reads ahead of the workers, so one
+    thread per core suffices. Elsewhere threads spend time blocked in
+    open/read, so oversubscribe (asyncio's default-executor heuristic)
+    to overlap that I/O latency.
+    """
+    cpus = os.cpu_count() or 4
+    if sys.platform.startswith("linux"):
+        return cpus
+    return min(32, cpus + 4)
+
+
+def compute_file_hashes(
+    root: Path,
+    rel_paths: List[str],
+    saved_hashes: Optional[Dict[bytes, bytes]] = None,
+    saved_stats: Optional[Dict[bytes, List[int]]] = None,
+) -> Tuple[Dict[bytes, bytes], Dict[bytes, List[int]]]:
+    """Hash files in parallel, keyed by path relative to root.
+
+    Keys are UTF-8 path bytes and hash values raw digest bytes — bytes
+    dicts hash and compare faster than str ones and hold no unicode
+    overhead; hex/str conversion happens at serialization. Returns
+    (file_hashes, file_stats) where file_stats maps each path to
+    [size, mtime_ns]. When saved hashes and stats from a previous run
+    are supplied, files whose size and mtime are unchanged reuse the
+    saved hash instead of re-reading content — a stat call instead of a
+    full read per unchanged file.
+
+    Hashing releases the GIL inside hashlib/blake3 update calls, so a
+    thread pool overlaps I/O and compute across files.
+    """
+    saved_hashes = saved_hashes or {}
+    saved_stats = saved_stats or {}
+    file_hashes: Dict[bytes, bytes] = {}
+    file_stats: Dict[bytes, List[int]] = {}
+    to_hash: List[Tuple[bytes, Path]] = []
+
+    for rel in rel_paths:
+        f = root / rel
+        key = rel.encode()
+        try:
+            st = os.stat(f)
+        except OSError:
+            # Vanished or unreadable; record no stat so it is always
+            # re-checked, and let compute_file_hash report b""
+            to_hash.append((key, f))
+            continue
+        stat_pair = [st.st_size, st.st_mtime_ns]
+        file_stats[key] = stat_pair
+        if key in saved_hashes and saved_stats.get(key) == stat_pair:
+            file_hashes[key] = saved_hashes[key]
+        else:
+            to_hash.append((key, f))
+
+    if len(to_hash) <= 1:
+        for rel, f in to_hash:
+            file_hashes[rel] = compute_file_hash(f)
+    else:
+        with ThreadPoolExecutor(max_workers=_hash_pool_size()) as executor:
+            hashes = executor.map(compute_file_hash, [f for _, f in to_hash])
+            for (rel, _), hash_val in zip(to_hash, hashes):
+                file_hashes[rel] = hash_val
+
+    return file_hashes, file_stats
+
+
+def scan_and_hash(
+    root: Path,
+    include_patterns: List[str],
+    exclude_patterns: List[str],
+    exceptions: List[str],
+    gitignore_patterns: List[str],
+    gitignore_negations: Optional[List[str]] = None,
+    saved_hashes: Optional[Dict[bytes, bytes]] = None,
+    saved_stats: Optional[Dict[bytes, List[int]]] = None,
+) -> Tuple[Dict[bytes, bytes], Dict[bytes, List[int]], List[str]]:
+    """Select and hash files in one step.
+
+    Routes through the cartographer_fast native extension (parallel
+    walk, glob selection and BLAKE3 hashing in Rust) when it is built,
+    and composes select_files + compute_file_hashes otherwise. Returns
+    (file_hashes, file_stats, selected relative paths).
+    """
+    # The native extension has no negation support; stay on the Python
+    # path when .gitignore re-includes are in play
+    if cartographer_fast is not None and not gitignore_negations:
+        saved: Dict[str, Tuple[str, int, int]] = {}
+        if saved_hashes and saved_stats:
+            for key, digest in saved_hashes.items():
+                stat_pair = saved_stats.get(key)
+                if stat_pair and len(stat_pair) == 2:
+                    saved[key.decode()] = (digest.hex(), stat_pair[0], stat_pair[1])
+        try:
+            rows = cartographer_fast.scan_and_hash(
+                str(root),
+                list(include_patterns),
+                list(exclude_patterns),
+                list(exceptions),
+                list(gitignore_patterns),
+                saved,
+            )
+        except (RuntimeError, ValueError):
+            rows = None  # unsupported pattern; use the Python path
+        if rows is not None:
+            rows.sort()
+            file_hashes = {
+                rel.encode(): bytes.fromhex(hash_val) for rel, hash_val, _, _ in rows
+            }
+            file_stats = {
+                rel.encode(): [size, mtime] for rel, _, size, mtime in rows
+            }
+            return file_hashes, file_stats, [rel for rel, _, _, _ in rows]
+
+    selected_files = select_files(
+        root,
+        include_patterns,
+        exclude_patterns,
+        exceptions,
+        gitignore_patterns,
+        gitignore_negations,
+    )
+    file_hashes, file_stats = compute_file_hashes(
+        root, selected_files, saved_hashes, saved_stats
+    )
+    return file_hashes, file_stats, selected_files
+
+
+def compute_folder_hash(folder: str, file_hashes: Dict[bytes, bytes]) -> str:
     """Compute a stable hash for a folder based on its files."""
+    prefix = folder.encode() + b"/"
     # Get all files in this folder
     folder_files = sorted(
         (path, hash_val)
         for path, hash_val in file_hashes.items()
-        if path.startswith(folder + "/") or (folder == "." and "/" not in path)
+        if path.startswith(prefix) or (folder == "." and b"/" not in path)
     )
-    
+
     if not folder_files:
         return ""
-    
+
     # Hash the concatenation of path:hash pairs
-    hasher = hashlib.md5()
+    hasher = _new_hasher()
     for path, hash_val in folder_files:
-        hasher.update(f"{path}:{hash_val}\n".encode())
+        hasher.update(path + b":" + hash_val + b"\n")
     return hasher.hexdigest()
 
 
-def get_folders_with_files(files: List[Path], root: Path) -> Set[str]:
+def compute_folder_hashes(
+    folders: Set[str], file_hashes: Dict[bytes, bytes]
+) -> Dict[str, str]:
+    """Compute hashes for all folders in one pass over file_hashes.
+
+    Produces the same digests as calling compute_folder_hash once per
+    folder, but feeds each file entry to an accumulator for every
+    ancestor folder instead of rescanning the whole file map per folder
+    — linear in files instead of folders x files.
+    """
+    accumulators: Dict[bytes, object] = {}
+    for path, hash_val in sorted(file_hashes.items()):
+        line = path + b":" + hash_val + b"\n"
+        if b"/" in path:
+            parts = path.split(b"/")[:-1]
+            ancestors = [b"/".join(parts[: i + 1]) for i in range(len(parts))]
+        else:
+            ancestors = [b"."]
+        for ancestor in ancestors:
+            hasher = accumulators.get(ancestor)
+            if hasher is None:
+                hasher = accumulators[ancestor] = _new_hasher()
+            hasher.update(line)
+    return {
+        folder: (
+            accumulators[folder.encode()].hexdigest()
+            if folder.encode() in accumulators
+            else ""
+        )
+        for folder in folders
+    }
+
+
+def get_folders_with_files(rel_paths: List[str]) -> Set[str]:
     """Get all unique folders that contain selected files."""
     folders = set()
-    for f in files:
-        rel = f.relative_to(root)
+    for rel in rel_paths:
         # Add all parent directories
-        parts = rel.parts[:-1]  # Exclude filename
+        parts = rel.split("/")[:-1]  # Exclude filename
         for i in range(len(parts)):
             folders.add("/".join(parts[: i + 1]))
     folders.add(".")  # Always include root
     return folders
 
 
+# Below this many combined entries the JIT'd diff can't amortize array
+# construction (and, on first run, compilation)
+NUMBA_DIFF_THRESHOLD = 10000
+
+if numba is not None and numpy is not None:
+
+    @numba.njit(cache=True)
+    def _cmp_rows(a, i, b, j):
+        """Lexicographically compare row i of a with row j of b."""
+        for k in range(a.shape[1]):
+            if a[i, k] < b[j, k]:
+                return -1
+            if a[i, k] > b[j, k]:
+                return 1
+        return 0
+
+    @numba.njit(cache=True)
+    def _diff_rows(cur_p, cur_h, sav_p, sav_h):
+        """Two-pointer merge over sorted fixed-width byte rows.
+
+        Returns index arrays (added into cur, removed into sav,
+        modified into cur).
+        """
+        n, m = cur_p.shape[0], sav_p.shape[0]
+        added = numpy.empty(n, numpy.int64)
+        removed = numpy.empty(m, numpy.int64)
+        modified = numpy.empty(min(n, m), numpy.int64)
+        na = nr = nm = 0
+        i = j = 0
+        while i < n and j < m:
+            cmp = _cmp_rows(cur_p, i, sav_p, j)
+            if cmp == 0:
+                for k in range(cur_h.shape[1]):
+                    if cur_h[i, k] != sav_h[j, k]:
+                        modified[nm] = i
+                        nm += 1
+                        break
+                i += 1
+                j += 1
+            elif cmp < 0:
+                added[na] = i
+                na += 1
+                i += 1
+            else:
+                removed[nr] = j
+                nr += 1
+                j += 1
+        while i < n:
+            added[na] = i
+            na += 1
+            i += 1
+        while j < m:
+            removed[nr] = j
+            nr += 1
+            j += 1
+        return added[:na], removed[:nr], modified[:nm]
+
+    def _rows_array(values: List[bytes], width: int):
+        """Pack variable-length bytes into a fixed-width uint8 matrix."""
+        buf = b"".join(v.ljust(width, b"\0") for v in values)
+        return numpy.frombuffer(buf, dtype=numpy.uint8).reshape(-1, width)
+
+    def _diff_items_numba(cur_items, saved_items):
+        cur_paths = [p for p, _ in cur_items]
+        sav_paths = [p for p, _ in saved_items]
+        # A leading length byte keeps a short digest (e.g. b"" from a
+        # failed hash) from comparing equal to a zero-padded longer one.
+        # Paths need no prefix: they contain no NUL, so padding can't
+        # make two different paths collide
+        cur_hashes = [bytes([len(h)]) + h for _, h in cur_items]
+        sav_hashes = [bytes([len(h)]) + h for _, h in saved_items]
+        path_width = max(map(len, cur_paths + sav_paths), default=1) or 1
+        hash_width = max(map(len, cur_hashes + sav_hashes), default=1) or 1
+        added_idx, removed_idx, modified_idx = _diff_rows(
+            _rows_array(cur_paths, path_width),
+            _rows_array(cur_hashes, hash_width),
+            _rows_array(sav_paths, path_width),
+            _rows_array(sav_hashes, hash_width),
+        )
+        return (
+            [cur_items[i][0] for i in added_idx],
+            [saved_items[j][0] for j in removed_idx],
+            [cur_items[i][0] for i in modified_idx],
+        )
+
+else:
+    _diff_items_numba = None
+
+if numpy is not None:
+
+    def _diff_maps_numpy(current, saved):
+        """Set-algebra diff via 64-bit path fingerprints and numpy.isin.
+
+        Each path is reduced to its built-in hash (64-bit, computed in C)
+        and membership runs vectorized over the fingerprint arrays. A
+        fingerprint hit only proves the fingerprint is shared, so hits
+        are confirmed against the real dicts before being classified —
+        a colliding pair degrades to one extra dict lookup, never to a
+        wrong answer.
+        """
+        cur_paths = list(current)
+        sav_paths = list(saved)
+        fps_cur = numpy.fromiter(
+            map(hash, cur_paths), numpy.int64, len(cur_paths)
+        )
+        fps_sav = numpy.fromiter(
+            map(hash, sav_paths), numpy.int64, len(sav_paths)
+        )
+        cur_hits = numpy.isin(fps_cur, fps_sav)
+        sav_hits = numpy.isin(fps_sav, fps_cur)
+
+        # A missing fingerprint is definitive: equal paths hash equally
+        added = [cur_paths[i] for i in numpy.flatnonzero(~cur_hits)]
+        removed = [sav_paths[j] for j in numpy.flatnonzero(~sav_hits)]
+        modified = []
+        for i in numpy.flatnonzero(cur_hits):
+            path = cur_paths[i]
+            saved_hash = saved.get(path)
+            if saved_hash is None:
+                added.append(path)
+            elif current[path] != saved_hash:
+                modified.append(path)
+        for j in numpy.flatnonzero(sav_hits):
+            path = sav_paths[j]
+            if path not in current:
+                removed.append(path)
+        added.sort()
+        removed.sort()
+        modified.sort()
+        return added, removed, modified
+
+else:
+    _diff_maps_numpy = None
+
+
+def diff_hashes(
+    current: Dict[bytes, bytes], saved: Dict[bytes, bytes]
+) -> Tuple[List[bytes], List[bytes], List[bytes]]:
+    """Diff two path->hash maps into (added, removed, modified) lists.
+
+    Works as a merge-join over the sorted items — one linear pass and no
+    intermediate key sets — so the output lists come back already sorted
+    for display (bytewise order equals code-point order for UTF-8 keys).
+    Large maps take a numba-compiled version of the same merge when
+    numba and numpy are installed, or a numpy fingerprint diff when
+    only numpy is; both return the same sorted lists.
+    """
+    total = len(current) + len(saved)
+    if total >= NUMBA_DIFF_THRESHOLD:
+        if _diff_items_numba is not None:
+            return _diff_items_numba(sorted(current.items()), sorted(saved.items()))
+        if _diff_maps_numpy is not None:
+            return _diff_maps_numpy(current, saved)
+
+    cur_items = sorted(current.items())
+    saved_items = sorted(saved.items())
+
+    added: List[bytes] = []
+    removed: List[bytes] = []
+    modified: List[bytes] = []
+
+    i = j = 0
+    n, m = len(cur_items), len(saved_items)
+    while i < n and j < m:
+        cur_path, cur_hash = cur_items[i]
+        saved_path, saved_hash = saved_items[j]
+        if cur_path == saved_path:
+            if cur_hash != saved_hash:
+                modified.append(cur_path)
+            i += 1
+            j += 1
+        elif cur_path < saved_path:
+            added.append(cur_path)
+            i += 1
+        else:
+            removed.append(saved_path)
+            j += 1
+    added.extend(path for path, _ in cur_items[i:])
+    removed.extend(path for path, _ in saved_items[j:])
+
+    return added, removed, modified
+
+
+def encode_state_maps(
+    file_hashes: Dict[bytes, bytes], file_stats: Dict[bytes, List[int]]
+) -> Tuple[Dict[str, str], Dict[str, List[int]]]:
+    """Convert the bytes-keyed working maps to their JSON representation."""
+    return (
+        {path.decode(): digest.hex() for path, digest in file_hashes.items()},
+        {path.decode(): stat_pair for path, stat_pair in file_stats.items()},
+    )
+
+
+def decode_state_maps(
+    state: dict,
+) -> Tuple[Dict[bytes, bytes], Dict[bytes, List[int]]]:
+    """Convert saved state maps back to bytes-keyed working maps."""
+    file_hashes: Dict[bytes, bytes] = {}
+    for path, hex_digest in state.get("file_hashes", {}).items():
+        try:
+            file_hashes[path.encode()] = bytes.fromhex(hex_digest)
+        except ValueError:
+            file_hashes[path.encode()] = b""
+    file_stats = {
+        path.encode(): stat_pair
+        for path, stat_pair in state.get("file_stat", {}).items()
+    }
+    return file_hashes, file_stats
+
+
 def load_state(root: Path) -> Optional[dict]:
-    """Load the current cartography state."""
-    state_path = root / STATE_DIR / STATE_FILE
+    """Load the current cartography state.
+
+    Prefers the msgpack sidecar when it is present and at least as new
+    as the JSON file; the JSON remains the canonical, human-readable
+    copy.
+    """
+    state_dir = root / STATE_DIR
+    state_path = state_dir / STATE_FILE
+
+    if msgpack is not None:
+        pack_path = state_dir / MSGPACK_FILE
+        try:
+            if pack_path.exists() and (
+                not state_path.exists()
+                or pack_path.stat().st_mtime >= state_path.stat().st_mtime
+            ):
+                return msgpack.unpackb(pack_path.read_bytes())
+        except (ValueError, OSError):
+            pass  # corrupt or racing sidecar; fall through to JSON
+
     if state_path.exists():
         try:
+            if orjson is not None:
+                return orjson.loads(state_path.read_bytes())
             with open(state_path, "r", encoding="utf-8") as f:
                 return json.load(f)
-        except (json.JSONDecodeError, IOError):
+        except (ValueError, IOError):
             return None
     return None
 
@@ -188,10 +940,18 @@ def save_state(root: Path, state: dict) -> None:
     """Save the cartography state."""
     state_dir = root / STATE_DIR
     state_dir.mkdir(parents=True, exist_ok=True)
-    
+
     state_path = state_dir / STATE_FILE
-    with open(state_path, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
+    if orjson is not None:
+        state_path.write_bytes(
+            orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+    else:
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+
+    if msgpack is not None:
+        (state_dir / MSGPACK_FILE).write_bytes(msgpack.packb(state))
 
 
 def create_empty_codemap(folder_path: Path, folder_name: str) -> None:
@@ -231,7 +991,7 @@ def cmd_init(args: argparse.Namespace) -> int:
         return 1
     
     # Load patterns
-    gitignore = load_gitignore(root)
+    gitignore, gitignore_negations = load_gitignore(root)
     include_patterns = args.include or ["**/*"]
     exclude_patterns = args.exclude or []
     exceptions = args.exception or []
@@ -241,25 +1001,18 @@ def cmd_init(args: argparse.Namespace) -> int:
     print(f"Exclude patterns: {exclude_patterns}")
     print(f"Exceptions: {exceptions}")
     
-    # Select files
-    selected_files = select_files(
-        root, include_patterns, exclude_patterns, exceptions, gitignore
+    # Select and hash files
+    file_hashes, file_stats, selected_files = scan_and_hash(
+        root, include_patterns, exclude_patterns, exceptions, gitignore,
+        gitignore_negations,
     )
-    
+
     print(f"Selected {len(selected_files)} files")
-    
-    # Compute file hashes
-    file_hashes: Dict[str, str] = {}
-    for f in selected_files:
-        rel_path = str(f.relative_to(root))
-        file_hashes[rel_path] = compute_file_hash(f)
-    
+
     # Get folders and compute folder hashes
-    folders = get_folders_with_files(selected_files, root)
-    folder_hashes: Dict[str, str] = {}
-    for folder in folders:
-        folder_hashes[folder] = compute_folder_hash(folder, file_hashes)
-    
+    folders = get_folders_with_files(selected_files)
+    folder_hashes = compute_folder_hashes(folders, file_hashes)
+
     # Create state
     state = {
         "metadata": {
@@ -270,9 +1023,11 @@ def cmd_init(args: argparse.Namespace) -> int:
             "exclude_patterns": exclude_patterns,
             "exceptions": exceptions,
         },
-        "file_hashes": file_hashes,
         "folder_hashes": folder_hashes,
     }
+    state["file_hashes"], state["file_stat"] = encode_state_maps(
+        file_hashes, file_stats
+    )
     
     # Save state
     save_state(root, state)
@@ -309,52 +1064,50 @@ def cmd_changes(args: argparse.Namespace) -> int:
     exclude_patterns = metadata.get("exclude_patterns", [])
     exceptions = metadata.get("exceptions", [])
     
-    gitignore = load_gitignore(root)
+    gitignore, gitignore_negations = load_gitignore(root)
     
-    # Select current files
-    current_files = select_files(
-        root, include_patterns, exclude_patterns, exceptions, gitignore
+    # Select and hash current files, reusing saved hashes for
+    # stat-unchanged files
+    saved_hashes, saved_stats = decode_state_maps(state)
+    current_hashes, _, _ = scan_and_hash(
+        root,
+        include_patterns,
+        exclude_patterns,
+        exceptions,
+        gitignore,
+        gitignore_negations,
+        saved_hashes,
+        saved_stats,
     )
-    
-    # Compute current hashes
-    current_hashes: Dict[str, str] = {}
-    for f in current_files:
-        rel_path = str(f.relative_to(root))
-        current_hashes[rel_path] = compute_file_hash(f)
-    
-    saved_hashes = state.get("file_hashes", {})
-    
-    # Find changes
-    added = set(current_hashes.keys()) - set(saved_hashes.keys())
-    removed = set(saved_hashes.keys()) - set(current_hashes.keys())
-    modified = {
-        path
-        for path in current_hashes.keys() & saved_hashes.keys()
-        if current_hashes[path] != saved_hashes[path]
-    }
-    
+
+    # Find changes with one linear merge over the sorted maps
+    added, removed, modified = diff_hashes(current_hashes, saved_hashes)
+    added = [path.decode() for path in added]
+    removed = [path.decode() for path in removed]
+    modified = [path.decode() for path in modified]
+
     if not added and not removed and not modified:
         print("No changes detected.")
         return 0
-    
+
     if added:
         print(f"\n{len(added)} added:")
-        for path in sorted(added):
+        for path in added:
             print(f"  + {path}")
-    
+
     if removed:
         print(f"\n{len(removed)} removed:")
-        for path in sorted(removed):
+        for path in removed:
             print(f"  - {path}")
-    
+
     if modified:
         print(f"\n{len(modified)} modified:")
-        for path in sorted(modified):
+        for path in modified:
             print(f"  ~ {path}")
-    
+
     # Show affected folders
     affected_folders = set()
-    for path in added | removed | modified:
+    for path in added + removed + modified:
         parts = Path(path).parts[:-1]
         for i in range(len(parts)):
             affected_folders.add("/".join(parts[: i + 1]))
@@ -382,28 +1135,31 @@ def cmd_update(args: argparse.Namespace) -> int:
     exclude_patterns = metadata.get("exclude_patterns", [])
     exceptions = metadata.get("exceptions", [])
     
-    gitignore = load_gitignore(root)
+    gitignore, gitignore_negations = load_gitignore(root)
     
-    # Select current files
-    selected_files = select_files(
-        root, include_patterns, exclude_patterns, exceptions, gitignore
+    # Select and hash current files, reusing saved hashes for
+    # stat-unchanged files
+    saved_hashes, saved_stats = decode_state_maps(state)
+    file_hashes, file_stats, selected_files = scan_and_hash(
+        root,
+        include_patterns,
+        exclude_patterns,
+        exceptions,
+        gitignore,
+        gitignore_negations,
+        saved_hashes,
+        saved_stats,
     )
-    
-    # Compute new hashes
-    file_hashes: Dict[str, str] = {}
-    for f in selected_files:
-        rel_path = str(f.relative_to(root))
-        file_hashes[rel_path] = compute_file_hash(f)
-    
+
     # Compute folder hashes
-    folders = get_folders_with_files(selected_files, root)
-    folder_hashes: Dict[str, str] = {}
-    for folder in folders:
-        folder_hashes[folder] = compute_folder_hash(folder, file_hashes)
-    
+    folders = get_folders_with_files(selected_files)
+    folder_hashes = compute_folder_hashes(folders, file_hashes)
+
     # Update state
     state["metadata"]["last_run"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    state["file_hashes"] = file_hashes
+    state["file_hashes"], state["file_stat"] = encode_state_maps(
+        file_hashes, file_stats
+    )
     state["folder_hashes"] = folder_hashes
     
     save_state(root, state)
@@ -0,0 +1,152 @@
+//! Native fast path for cartographer.py: directory walk, glob selection
+//! and BLAKE3 hashing in one call.
+//!
+//! Selection semantics mirror the Python implementation: hidden
+//! directories are skipped, symlinked directories are not followed
+//! (though symlinked files are kept, like the Python walkers),
+//! gitignore rejects unconditionally, excludes are overridden by
+//! exception paths, and a file is kept when an include pattern or an
+//! exception matches. Pattern anchoring follows cartographer's
+//! glob-to-regex rules (unanchored unless the pattern starts with "/",
+//! trailing "/" means "everything underneath").
+
+use std::collections::{HashMap, HashSet};
+use std::path::Path;
+use std::time::UNIX_EPOCH;
+
+use globset::{Glob, GlobBuilder, GlobSet, GlobSetBuilder};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use rayon::prelude::*;
+use walkdir::WalkDir;
+
+fn build_set(patterns: &[String]) -> PyResult<GlobSet> {
+    let mut builder = GlobSetBuilder::new();
+    for pat in patterns {
+        let trimmed = pat.trim_end_matches('/');
+        let body = if pat.ends_with('/') {
+            format!("{trimmed}/**")
+        } else {
+            trimmed.to_string()
+        };
+        if let Some(anchored) = body.strip_prefix('/') {
+            builder.add(glob(anchored)?);
+        } else {
+            // Unanchored: match at the root and at any depth
+            builder.add(glob(&body)?);
+            builder.add(glob(&format!("**/{body}"))?);
+        }
+    }
+    builder
+        .build()
+        .map_err(|e| PyValueError::new_err(e.to_string()))
+}
+
+fn glob(pattern: &str) -> PyResult<Glob> {
+    // literal_separator keeps * and ? from crossing "/" — same as the
+    // Python glob-to-regex translation ("*" -> "[^/]*")
+    GlobBuilder::new(pattern)
+        .literal_separator(true)
+        .build()
+        .map_err(|e| PyValueError::new_err(e.to_string()))
+}
+
+/// Walk `root`, select files by the pattern lists, and return
+/// `(rel_path, hex_hash, size, mtime_ns)` rows. Entries in `saved`
+/// (`rel_path -> (hex_hash, size, mtime_ns)`) whose size and mtime
+/// still match are reused without reading the file.
+#[pyfunction]
+#[pyo3(signature = (root, include, exclude, exceptions, gitignore, saved=None))]
+fn scan_and_hash(
+    py: Python<'_>,
+    root: String,
+    include: Vec<String>,
+    exclude: Vec<String>,
+    exceptions: Vec<String>,
+    gitignore: Vec<String>,
+    saved: Option<HashMap<String, (String, u64, u64)>>,
+) -> PyResult<Vec<(String, String, u64, u64)>> {
+    let include_set = build_set(&include)?;
+    let exclude_set = build_set(&exclude)?;
+    let gitignore_set = build_set(&gitignore)?;
+    let exception_set: HashSet<&str> = exceptions.iter().map(String::as_str).collect();
+    let saved = saved.unwrap_or_default();
+
+    let root_path = Path::new(&root);
+    let mut selected: Vec<String> = Vec::new();
+
+    let walker = WalkDir::new(root_path)
+        .follow_links(false)
+        .into_iter()
+        .filter_entry(|e| {
+            e.depth() == 0
+                || !(e.file_type().is_dir()
+                    && e.file_name().to_string_lossy().starts_with('.'))
+        });
+    for entry in walker.flatten() {
+        let file_type = entry.file_type();
+        if !file_type.is_file() {
+            // The Python walkers select symlinked files too; keep
+            // symlinks whose target resolves to a regular file
+            let is_file_link = file_type.is_symlink()
+                && entry.path().metadata().map(|m| m.is_file()).unwrap_or(false);
+            if !is_file_link {
+                continue;
+            }
+        }
+        let rel = match entry.path().strip_prefix(root_path) {
+            Ok(rel) => rel.to_string_lossy().replace('\\', "/"),
+            Err(_) => continue,
+        };
+        if gitignore_set.is_match(&rel) {
+            continue;
+        }
+        let is_exception = exception_set.contains(rel.as_str());
+        if exclude_set.is_match(&rel) && !is_exception {
+            continue;
+        }
+        if include_set.is_match(&rel) || is_exception {
+            selected.push(rel);
+        }
+    }
+
+    let rows = py.allow_threads(|| {
+        selected
+            .into_par_iter()
+            .map(|rel| {
+                let path = root_path.join(&rel);
+                let (size, mtime_ns) = match std::fs::metadata(&path) {
+                    Ok(meta) => {
+                        let mtime = meta
+                            .modified()
+                            .ok()
+                            .and_then(|t| t.duration_since(UNIX_EPOCH).ok())
+                            .map(|d| d.as_nanos() as u64)
+                            .unwrap_or(0);
+                        (meta.len(), mtime)
+                    }
+                    Err(_) => (0, 0),
+                };
+                if let Some((hash, s_size, s_mtime)) = saved.get(&rel) {
+                    if *s_size == size && *s_mtime == mtime_ns {
+                        return (rel, hash.clone(), size, mtime_ns);
+                    }
+                }
+                let mut hasher = blake3::Hasher::new();
+                let hash = match hasher.update_mmap_rayon(&path) {
+                    Ok(_) => hasher.finalize().to_hex().to_string(),
+                    Err(_) => String::new(),
+                };
+                (rel, hash, size, mtime_ns)
+            })
+            .collect()
+    });
+
+    Ok(rows)
+}
+
+#[pymodule]
+fn cartographer_fast(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(scan_and_hash, m)?)?;
+    Ok(())
+}
@@ -5,7 +5,15 @@ import json
 import tempfile
 import hashlib
 from pathlib import Path
-from cartographer import PatternMatcher, compute_file_hash, compute_folder_hash, select_files
+from cartographer import (
+    PatternMatcher,
+    compute_file_hash,
+    compute_file_hashes,
+    compute_folder_hash,
+    compute_folder_hashes,
+    diff_hashes,
+    select_files,
+)
 
 class TestCartographer(unittest.TestCase):
     def test_pattern_matcher(self):
@@ -30,6 +38,49 @@ class TestCartographer(unittest.TestCase):
         self.assertFalse(matcher.matches("README.md"))
         self.assertFalse(matcher.matches("tests/test.py"))
 
+    def test_pattern_fast_paths_agree_with_regex(self):
+        import re
+        from cartographer import _glob_to_regex
+
+        patterns = ["**/*.ts", "*.log", "package.json", "dist/", "src/**/*.py"]
+        matcher = PatternMatcher(patterns)
+        combined = re.compile("|".join(_glob_to_regex(p) for p in patterns))
+
+        paths = [
+            "a.ts",
+            "src/deep/b.ts",
+            "x/y.log",
+            "package.json",
+            "vendor/package.json",
+            "dist/out.js",
+            "a/dist/out.js",
+            "src/a/b.py",
+            "README.md",
+            "b.ts.bak",
+            "distx/f.js",
+            "package.json5",
+        ]
+        for path in paths:
+            self.assertEqual(
+                matcher.matches(path), bool(combined.search(path)), path
+            )
+
+    def test_hyperscan_cache_roundtrip(self):
+        from cartographer import hyperscan
+        if hyperscan is None:
+            self.skipTest("hyperscan not installed")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            patterns = ["src/**/*.ts", "build*/"]
+
+            first = PatternMatcher(patterns, cache_dir)
+            self.assertTrue(list(cache_dir.glob("patterns-*.db")))
+
+            # Second construction loads the serialized database
+            second = PatternMatcher(patterns, cache_dir)
+            for path in ["src/a/b.ts", "build-out/x.js", "README.md"]:
+                self.assertEqual(second.matches(path), first.matches(path), path)
+
     def test_compute_file_hash(self):
         # Use binary mode to avoid any newline translation issues
         with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
@@ -38,19 +89,41 @@ class TestCartographer(unittest.TestCase):
         
         try:
             h1 = compute_file_hash(Path(f_path))
-            # md5 of b"test content" is 9473fdd0d880a43c21b7778d34872157
-            expected = hashlib.md5(b"test content").hexdigest()
+            # BLAKE3 when the wheel is installed, MD5 otherwise;
+            # raw digest bytes either way
+            try:
+                import blake3
+                expected = blake3.blake3(b"test content").digest()
+            except ImportError:
+                expected = hashlib.md5(b"test content").digest()
             self.assertEqual(h1, expected)
-            self.assertEqual(h1, "9473fdd0d880a43c21b7778d34872157")
         finally:
             if os.path.exists(f_path):
                 os.unlink(f_path)
 
+    def test_compute_file_hashes_stat_prefilter(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.txt").write_text("aaa")
+            files = ["a.txt"]
+
+            hashes, stats = compute_file_hashes(root, files)
+            self.assertEqual(hashes[b"a.txt"], compute_file_hash(root / "a.txt"))
+
+            # Unchanged size/mtime -> saved hash reused without re-reading
+            reused, _ = compute_file_hashes(root, files, {b"a.txt": b"sentinel"}, stats)
+            self.assertEqual(reused[b"a.txt"], b"sentinel")
+
+            # Changed content -> stat differs -> re-hashed
+            (root / "a.txt").write_text("bbbb")
+            rehashed, _ = compute_file_hashes(root, files, {b"a.txt": b"sentinel"}, stats)
+            self.assertEqual(rehashed[b"a.txt"], compute_file_hash(root / "a.txt"))
+
     def test_compute_folder_hash(self):
         file_hashes = {
-            "src/a.ts": "hash-a",
-            "src/b.ts": "hash-b",
-            "tests/test.ts": "hash-test"
+            b"src/a.ts": b"hash-a",
+            b"src/b.ts": b"hash-b",
+            b"tests/test.ts": b"hash-test"
         }
         
         h1 = compute_folder_hash("src", file_hashes)
@@ -58,12 +131,72 @@ class TestCartographer(unittest.TestCase):
         self.assertEqual(h1, h2)
         
         file_hashes_alt = {
-            "src/a.ts": "hash-a-modified",
-            "src/b.ts": "hash-b"
+            b"src/a.ts": b"hash-a-modified",
+            b"src/b.ts": b"hash-b"
         }
         h3 = compute_folder_hash("src", file_hashes_alt)
         self.assertNotEqual(h1, h3)
 
+    def test_compute_folder_hashes_matches_per_folder(self):
+        file_hashes = {
+            b"src/a.ts": b"hash-a",
+            b"src/utils/b.ts": b"hash-b",
+            b"tests/test.ts": b"hash-test",
+            b"README.md": b"hash-readme",
+        }
+        folders = {".", "src", "src/utils", "tests", "empty"}
+
+        batch = compute_folder_hashes(folders, file_hashes)
+        for folder in folders:
+            self.assertEqual(batch[folder], compute_folder_hash(folder, file_hashes))
+
+    def test_diff_hashes(self):
+        saved = {b"a.ts": b"h1", b"b.ts": b"h2", b"c.ts": b"h3"}
+        current = {b"b.ts": b"h2", b"c.ts": b"h3-new", b"d.ts": b"h4"}
+
+        added, removed, modified = diff_hashes(current, saved)
+        self.assertEqual(added, [b"d.ts"])
+        self.assertEqual(removed, [b"a.ts"])
+        self.assertEqual(modified, [b"c.ts"])
+
+        self.assertEqual(diff_hashes(saved, saved), ([], [], []))
+
+    def test_diff_hashes_numba_parity(self):
+        from cartographer import _diff_items_numba
+        if _diff_items_numba is None:
+            self.skipTest("numba not installed")
+        saved = {
+            b"a.ts": b"h1",
+            b"b.ts": b"h2",
+            b"c.ts": b"h3",
+            # Failed hash vs an all-zero digest must count as modified
+            b"z.ts": b"",
+        }
+        current = {
+            b"b.ts": b"h2",
+            b"c.ts": b"h3-new",
+            b"d.ts": b"h4",
+            b"z.ts": b"\x00" * 16,
+        }
+        self.assertEqual(
+            _diff_items_numba(sorted(current.items()), sorted(saved.items())),
+            diff_hashes(current, saved),
+        )
+        self.assertEqual(
+            _diff_items_numba(sorted(saved.items()), sorted(saved.items())),
+            ([], [], []),
+        )
+
+    def test_diff_hashes_numpy_parity(self):
+        from cartographer import _diff_maps_numpy
+        if _diff_maps_numpy is None:
+            self.skipTest("numpy not installed")
+        saved = {b"a.ts": b"h1", b"b.ts": b"h2", b"c.ts": b"h3"}
+        current = {b"b.ts": b"h2", b"c.ts": b"h3-new", b"d.ts": b"h4"}
+        self.assertEqual(
+            _diff_maps_numpy(current, saved), diff_hashes(current, saved)
+        )
+
     def test_select_files(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -78,10 +211,50 @@ class TestCartographer(unittest.TestCase):
             excludes = ["**/*.test.ts", "node_modules/"]
             exceptions = []
             
-            selected = select_files(root, includes, excludes, exceptions, [])
-            
-            rel_selected = sorted([os.path.relpath(f, root) for f in selected])
-            self.assertEqual(rel_selected, ["package.json", "src/index.ts"])
+            selected = select_files(root, includes, excludes, exceptions, [], sort=True)
+
+            self.assertEqual(selected, ["package.json", "src/index.ts"])
+
+    def test_native_selection_matches_select_files(self):
+        from cartographer import cartographer_fast
+        if cartographer_fast is None:
+            self.skipTest("cartographer_fast not built")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "src" / "deep").mkdir(parents=True)
+            (root / "src" / "x.ts").write_text("a")
+            (root / "src" / "deep" / "y.ts").write_text("b")
+            (root / "node_modules").mkdir()
+            (root / "node_modules" / "m.ts").write_text("c")
+            (root / "real.ts").write_text("d")
+            os.symlink(root / "real.ts", root / "link.ts")
+
+            # src/*.ts must not cross "/" (src/deep/y.ts stays out) and
+            # the symlinked file must be selected, as in Python
+            include = ["src/*.ts", "link.ts"]
+            exclude = ["node_modules/"]
+            rows = cartographer_fast.scan_and_hash(
+                str(root), include, exclude, [], []
+            )
+            native = sorted(row[0] for row in rows)
+            expected = select_files(root, include, exclude, [], [], sort=True)
+            self.assertEqual(native, expected)
+
+    def test_select_files_gitignore_negation(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "logs").mkdir()
+            (root / "logs" / "debug.log").write_text("noise")
+            (root / "logs" / "keep.log").write_text("important")
+
+            (root / ".gitignore").write_text("*.log\n!keep.log\n")
+            from cartographer import load_gitignore
+            gitignore, negations = load_gitignore(root)
+            self.assertEqual(gitignore, ["*.log"])
+            self.assertEqual(negations, ["keep.log"])
+
+            selected = select_files(root, ["**/*.log"], [], [], gitignore, negations)
+            self.assertEqual(sorted(selected), ["logs/keep.log"])
 
 if __name__ == "__main__":
     unittest.main()